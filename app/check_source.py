@@ -1,19 +1,206 @@
+import asyncio
 import hashlib
 import logging
 import re
-from uuid import UUID
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, NoReturn
+from uuid import UUID, uuid4
 
 import httpx
-from bs4 import BeautifulSoup
 from fastapi import HTTPException
 from lxml import etree
-from sqlmodel import desc, select
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from sqlalchemy import bindparam
+from sqlalchemy.orm import raiseload
+from sqlmodel import col, desc, insert, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-from .models.articles import Article, ArticleCreate, WatchLog, WatchLogCreate
+from .config import config
+from .db import async_sessionmaker
+from .models.articles import Article, WatchLog
 from .models.sources import Source, WatchableSelectorType
-from .models.urls import AnyUrl
+
+
+@lru_cache(maxsize=512)
+def _compiled_css(selector: str) -> CSSSelector:
+    """Compile a CSS selector into an lxml XPath evaluator, cached per selector."""
+    return CSSSelector(selector, translator="html")
+
+
+@lru_cache(maxsize=512)
+def _compiled_xpath(selector: str) -> etree.XPath:
+    """Compile an XPath expression, cached per selector."""
+    return etree.XPath(selector)
+
+
+def _node_text(node: lxml_html.HtmlElement | str) -> str:
+    """Get the stripped text of a selector match.
+
+    String results (`text()` or attribute XPath matches) are used as is, elements contribute
+    their whole text content.
+    """
+    if isinstance(node, str):
+        return node.strip()
+    return node.text_content().strip()
+
+
+@lru_cache(maxsize=512)
+def _compiled_regex(selector: str) -> re.Pattern[str]:
+    """Compile a regular expression, cached per selector."""
+    return re.compile(selector)
+
+
+def _decode(content: bytes, encoding: str | None) -> str:
+    """Decode content with the given encoding, falling back to UTF-8 if it is missing or unknown."""
+    try:
+        return content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+def _is_utf8(content: bytes) -> bool:
+    """Check whether content is valid UTF-8."""
+    try:
+        content.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _parse_html(content: bytes, encoding: str | None) -> lxml_html.HtmlElement | None:
+    """Parse raw HTML into an lxml tree, or None if the document has no elements.
+
+    The document is decoded with the given encoding if libxml2 knows it. Otherwise valid UTF-8
+    is decoded as such, as BeautifulSoup's encoding detection did, and anything else is left to
+    lxml, which uses the document's `<meta charset>`.
+    """
+    if encoding:
+        try:
+            return etree.HTML(content, parser=lxml_html.HTMLParser(encoding=encoding))
+        except LookupError:
+            pass
+    return etree.HTML(content, parser=lxml_html.HTMLParser(encoding="utf-8" if _is_utf8(content) else None))
+
+
+def _extract_css(content: bytes, selector: str, encoding: str | None) -> str:
+    """Extract the text of all elements matching a CSS selector."""
+    root = _parse_html(content, encoding)
+    if root is None:
+        return ""
+    return "\n".join(_node_text(el) for el in _compiled_css(selector)(root))
+
+
+def _extract_xpath(content: bytes, selector: str, encoding: str | None) -> str:
+    """Extract the text of all nodes matching an XPath expression."""
+    root = _parse_html(content, encoding)
+    if root is None:
+        return ""
+    return "\n".join(_node_text(el) for el in _compiled_xpath(selector)(root))
+
+
+def _extract_regex(content: bytes, selector: str, encoding: str | None) -> str:
+    """Extract all matches of a regular expression from the decoded content.
+
+    Like `re.findall`, only the captured groups are kept when the pattern has any.
+    """
+    pattern = _compiled_regex(selector)
+    text = _decode(content, encoding)
+    if pattern.groups:
+        return "\n".join(" ".join(g or "" for g in m.groups()) for m in pattern.finditer(text))
+    return "\n".join(m.group(0) for m in pattern.finditer(text))
+
+
+_EXTRACTORS: dict[WatchableSelectorType, Callable[[bytes, str, str | None], str]] = {
+    WatchableSelectorType.CSS: _extract_css,
+    WatchableSelectorType.XPATH: _extract_xpath,
+    WatchableSelectorType.REGEX: _extract_regex,
+}
+
+
+def log_check_error(logger: logging.Logger, source_uuid: UUID, error: BaseException) -> None:
+    """Log a failed source check.
+
+    Expected failures are raised as `HTTPException` and have already been logged where they were
+    raised, so only their message is logged. Unexpected errors are logged with their traceback.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        The logger to log the error with
+    source_uuid : UUID
+        UUID of the source whose check failed
+    error : BaseException
+        The error the check failed with
+    """
+    logger.error(
+        "Error checking source %s: %s",
+        source_uuid,
+        error,
+        exc_info=None if isinstance(error, HTTPException) else error,
+    )
+
+
+# Statements are built once, the source UUID is bound at execution time.
+_SOURCE_BY_UUID = select(Source).where(Source.uuid == bindparam("uuid"), Source.active).options(raiseload("*"))
+_LATEST_WATCHLOG = (
+    select(WatchLog)
+    .where(WatchLog.source_uuid == bindparam("uuid"), WatchLog.active)
+    .order_by(desc(WatchLog.created_at))
+    .limit(1)
+    .options(raiseload("*"))
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FetchedContent:
+    """Body of a fetched source together with its HTTP cache validators.
+
+    Attributes
+    ----------
+    content : bytes
+        The raw, undecoded response body
+    content_hash : str
+        SHA-256 hex digest of `content`, computed while downloading
+    etag : str, optional
+        Value of the `ETag` response header
+    last_modified : str, optional
+        Value of the `Last-Modified` response header
+    encoding : str, optional
+        Charset declared in the `Content-Type` response header
+    """
+
+    content: bytes
+    content_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+    encoding: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _WatchState:
+    """What is known about the latest watchlog of a source."""
+
+    watchlog_uuid: UUID
+    content_hash: str | None
+    etag: str | None
+    last_modified: str | None
+
+    @classmethod
+    def from_watchlog(cls, watchlog: WatchLog) -> "_WatchState":
+        return cls(watchlog.uuid, watchlog.content_hash, watchlog.etag, watchlog.last_modified)
+
+
+@dataclass(frozen=True, slots=True)
+class _ContentChange:
+    """Rows to insert for a detected content change of a source."""
+
+    source_uuid: UUID
+    watchlog: dict[str, Any]
+    article: dict[str, Any]
 
 
 class CheckSourceService:
@@ -26,6 +213,9 @@ class CheckSourceService:
     ----------
     session : AsyncSession
         SQLModel async session for database operations
+    client : httpx.AsyncClient, optional
+        HTTP client to fetch sources with. If not provided, the service creates its own
+        long-lived client and closes it in `aclose`.
 
     Attributes
     ----------
@@ -35,86 +225,179 @@ class CheckSourceService:
         Logger for the service
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, client: httpx.AsyncClient | None = None):
         self.session = session
         self.logger = logging.getLogger(__name__)
 
+        # Latest known watchlog state per source, lets repeated checks skip the watchlog lookup.
+        self._seen: dict[UUID, _WatchState] = {}
+
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=10.0,
+            http2=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, if it is owned by the service."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    def with_session(self, session: AsyncSession) -> "CheckSourceService":
+        """Create a service bound to another session, sharing the HTTP client and hash cache.
+
+        The HTTP client stays owned by this service, closing the returned service is not needed.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            The session the new service operates on
+
+        Returns
+        -------
+        CheckSourceService
+            A service using `session` for database operations
+        """
+        service = CheckSourceService(session=session, client=self._client)
+        service._seen = self._seen
+        return service
+
     @retry(
         retry=retry_if_exception_type(httpx.HTTPError),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
         reraise=True,
     )
-    async def _fetch_with_retry(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+    async def _fetch_with_retry(
+        self, client: httpx.AsyncClient, url: str, headers: dict[str, str] | None = None
+    ) -> FetchedContent | None:
         """Execute HTTP GET request with automatic retries.
 
+        The body is streamed and the download is aborted as soon as it exceeds
+        `config.max_content_bytes`.
+
         Parameters
         ----------
         client : httpx.AsyncClient
             The HTTP client to use for requests
         url : str
             The URL to fetch content from
+        headers : dict[str, str], optional
+            Additional request headers, by default None
 
         Returns
         -------
-        httpx.Response
-            The HTTP response
+        FetchedContent or None
+            The fetched content, or None on `304 Not Modified`
 
         Raises
         ------
         httpx.HTTPError
             If the request fails after all retry attempts
+        HTTPException
+            If the response body is larger than `config.max_content_bytes`
         """
-        self.logger.debug(f"Fetching content from {url}")
-        response = await client.get(url, timeout=10.0)
-        response.raise_for_status()
-        self.logger.debug(f"Successfully fetched content from {url} (status code: {response.status_code})")
-        return response
+        self.logger.debug("Fetching content from %s", url)
+        max_bytes = config.max_content_bytes
+        async with client.stream("GET", url, headers=headers, timeout=httpx.Timeout(10.0, read=30.0)) as response:
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                return None
+            response.raise_for_status()
+
+            # Bail out before reading anything when the server already announces an oversized body.
+            content_length = response.headers.get("Content-Length", "")
+            if content_length.isdigit() and int(content_length) > max_bytes:
+                self._raise_too_large(url, max_bytes)
+
+            buffer = bytearray()
+            digest = hashlib.sha256()
+            async for chunk in response.aiter_bytes():
+                buffer.extend(chunk)
+                digest.update(chunk)
+                if len(buffer) > max_bytes:
+                    self._raise_too_large(url, max_bytes)
+
+            self.logger.debug("Successfully fetched content from %s (status code: %s)", url, response.status_code)
+            return FetchedContent(
+                content=bytes(buffer),
+                content_hash=digest.hexdigest(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                encoding=response.charset_encoding,
+            )
 
-    async def fetch_content(self, url: str) -> str:
+    def _raise_too_large(self, url: str, max_bytes: int) -> NoReturn:
+        """Log and raise the error for a response body over the size limit."""
+        self.logger.error("Content at %s exceeds the limit of %s bytes", url, max_bytes)
+        raise HTTPException(status_code=413, detail=f"Source content exceeds the limit of {max_bytes} bytes")
+
+    async def fetch_content(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> FetchedContent | None:
         """Fetch content from a URL with automatic retries.
 
-        Uses exponential backoff retry strategy for transient errors.
+        Uses exponential backoff retry strategy for transient errors. When validators of a
+        previous response are given, the request is made conditional.
 
         Parameters
         ----------
         url : str
             The URL to fetch content from
+        etag : str, optional
+            ETag of the previous response, sent as `If-None-Match`
+        last_modified : str, optional
+            Last-Modified of the previous response, sent as `If-Modified-Since`
 
         Returns
         -------
-        str
-            The raw content retrieved from the URL
+        FetchedContent or None
+            The raw content retrieved from the URL, or None if the server reported that
+            the content has not been modified
 
         Raises
         ------
         HTTPException
-            If there's an error fetching the content after all retries are exhausted
+            If there's an error fetching the content after all retries are exhausted,
+            or if the content is larger than `config.max_content_bytes`
         """
         try:
-            self.logger.info(f"Fetching content from URL: {url}")
-            async with httpx.AsyncClient() as client:
-                response = await self._fetch_with_retry(client, url)
-                content = response.text
-                self.logger.info(f"Successfully fetched {len(content)} bytes from {url}")
-                return content
+            self.logger.info("Fetching content from URL: %s", url)
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+            fetched = await self._fetch_with_retry(self._client, url, headers=headers)
+            if fetched is None:
+                self.logger.info("Content at %s not modified", url)
+                return None
+
+            self.logger.info("Successfully fetched %s bytes from %s", len(fetched.content), url)
+            return fetched
         except httpx.HTTPError as e:
-            self.logger.error(f"Error fetching content from {url}: {str(e)}")
+            self.logger.error("Error fetching content from %s: %s", url, e)
             raise HTTPException(
                 status_code=500, detail=f"Error fetching source content after multiple attempts: {str(e)}"
             ) from e
 
-    def extract_content(self, content: str, selector: str, selector_type: WatchableSelectorType) -> str:
+    def extract_content(
+        self, content: bytes, selector: str, selector_type: WatchableSelectorType, encoding: str | None = None
+    ) -> str:
         """Extract content from raw HTML/text using the specified selector.
 
         Parameters
         ----------
-        content : str
+        content : bytes
             Raw content from the source
         selector : str
             The selector to use for extraction
         selector_type : WatchableSelectorType
             The type of selector (CSS, XPATH, REGEX)
+        encoding : str, optional
+            Charset declared by the server. Without one, HTML is decoded as UTF-8 if it is valid
+            UTF-8 and by its `<meta charset>` otherwise, other content is decoded as UTF-8.
 
         Returns
         -------
@@ -132,44 +415,32 @@ class CheckSourceService:
 
         if not selector:
             self.logger.info("No selector provided, returning full content")
-            return content
+            return _decode(content, encoding)
 
         try:
-            self.logger.debug(f"Extracting content using {selector_type} selector: {selector}")
-
-            if selector_type == WatchableSelectorType.CSS:
-                soup = BeautifulSoup(content, "html.parser")
-                elements = soup.select(selector)
-                extracted = "\n".join([el.get_text().strip() for el in elements])
-
-            elif selector_type == WatchableSelectorType.XPATH:
-                tree = etree.HTML(content.encode(), parser=etree.HTMLParser())
-                elements = tree.xpath(selector)
-                extracted = "\n".join([el.text.strip() if hasattr(el, "text") else str(el) for el in elements])
-
-            elif selector_type == WatchableSelectorType.REGEX:
-                matches = re.findall(selector, content)
-                extracted = "\n".join(matches)
+            extractor = _EXTRACTORS[selector_type]
+        except KeyError:
+            self.logger.error("Unsupported selector type: %s", selector_type)
+            raise HTTPException(status_code=400, detail=f"Unsupported selector type: {selector_type}") from None
 
-            else:
-                self.logger.error(f"Unsupported selector type: {selector_type}")
-                raise HTTPException(status_code=400, detail=f"Unsupported selector type: {selector_type}")
-
-            self.logger.info(f"Successfully extracted {len(extracted)} bytes of content")
+        try:
+            self.logger.debug("Extracting content using %s selector: %s", selector_type, selector)
+            extracted = extractor(content, selector, encoding)
+            self.logger.info("Successfully extracted %s bytes of content", len(extracted))
             return extracted
         except Exception as e:
-            self.logger.exception(f"Error extracting content with {selector_type} selector: {str(e)}")
+            self.logger.exception("Error extracting content with %s selector: %s", selector_type, e)
             raise HTTPException(
                 status_code=500, detail=f"Error extracting content with {selector_type} selector: {str(e)}"
             ) from e
 
-    def calculate_hash(self, content: str) -> str:
+    def calculate_hash(self, content: str | bytes) -> str:
         """Calculate SHA-256 hash of content.
 
         Parameters
         ----------
-        content : str
-            The content to hash
+        content : str or bytes
+            The content to hash. Strings are UTF-8 encoded, bytes are hashed as is.
 
         Returns
         -------
@@ -178,10 +449,13 @@ class CheckSourceService:
         """
         if not content:
             self.logger.warning("Empty content provided for hashing")
-            content = ""
+            content = b""
+
+        if isinstance(content, str):
+            content = content.encode("utf-8")
 
-        hash_value = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        self.logger.debug(f"Calculated content hash: {hash_value[:8]}...")
+        hash_value = hashlib.sha256(content).hexdigest()
+        self.logger.debug("Calculated content hash: %s...", hash_value[:8])
         return hash_value
 
     async def get_latest_watchlog(self, source_uuid: UUID) -> WatchLog | None:
@@ -197,26 +471,19 @@ class CheckSourceService:
         Optional[WatchLog]
             The most recent watchlog entry, or None if no entries exist
         """
-        self.logger.debug(f"Getting latest watchlog for source {source_uuid}")
-        stmt = (
-            select(WatchLog)
-            .where(WatchLog.source_uuid == source_uuid, WatchLog.active)
-            .order_by(desc(WatchLog.created_at))
-            .limit(1)
-        )
-        result = await self.session.exec(stmt)
+        self.logger.debug("Getting latest watchlog for source %s", source_uuid)
+        result = await self.session.exec(_LATEST_WATCHLOG, params={"uuid": source_uuid})
         watchlog = result.first()
 
         if watchlog:
-            await self.session.refresh(watchlog)
-            self.logger.debug(f"Found watchlog {watchlog.uuid} from {watchlog.created_at}")
+            self.logger.debug("Found watchlog %s from %s", watchlog.uuid, watchlog.created_at)
         else:
-            self.logger.info(f"No previous watchlog found for source {source_uuid}")
+            self.logger.info("No previous watchlog found for source %s", source_uuid)
 
         return watchlog
 
-    async def create_article(self, watchlog_uuid: UUID, source_uri: str, extracted_content: str) -> Article:
-        """Create a new article from extracted content.
+    def _article_values(self, watchlog_uuid: UUID, source_uri: str, extracted_content: str) -> dict[str, Any]:
+        """Build the column values of a new article from extracted content.
 
         Parameters
         ----------
@@ -229,38 +496,38 @@ class CheckSourceService:
 
         Returns
         -------
-        Article
-            The newly created article
+        dict[str, Any]
+            Column values of the new article
         """
-        self.logger.info(f"Creating new article for watchlog {watchlog_uuid}")
-
         content = extracted_content or ""
-        lines = content.split("\n")
-        title = lines[0][:100].strip() if lines else ""
+        newline = content.find("\n")
+        title = (content[:newline] if newline >= 0 else content)[:100].strip()
 
         if not title:
             title = "New content from source"
-            self.logger.warning(f"No title could be extracted, using default: '{title}'")
+            self.logger.warning("No title could be extracted, using default: '%s'", title)
 
         description = content[:200].strip() if len(content) > 30 else None
 
-        article_data = ArticleCreate(
-            watchlog_uuid=watchlog_uuid,
-            title=title,
-            uri=AnyUrl(source_uri),
-            description=description,
-            is_newsworthy=True,
-        )
-
-        article = Article(**article_data.model_dump())
-        self.session.add(article)
-        await self.session.commit()
-        await self.session.refresh(article)
-        self.logger.info(f"Created article {article.uuid}: {title}")
-        return article
-
-    async def create_watchlog(self, source_uuid: UUID, previous_uuid: UUID | None, content_hash: str) -> WatchLog:
-        """Create a new watchlog entry.
+        return {
+            "uuid": uuid4(),
+            "watchlog_uuid": watchlog_uuid,
+            "title": title,
+            # Source.uri was validated when the source was stored, so it is not validated again here.
+            "uri": source_uri,
+            "description": description,
+            "is_newsworthy": True,
+        }
+
+    def _watchlog_values(
+        self,
+        source_uuid: UUID,
+        previous_uuid: UUID | None,
+        content_hash: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the column values of a new watchlog entry.
 
         Parameters
         ----------
@@ -270,21 +537,63 @@ class CheckSourceService:
             UUID of the previous watchlog entry, if any
         content_hash : str
             Hash of the extracted content
+        etag : str, optional
+            ETag of the response the content was extracted from
+        last_modified : str, optional
+            Last-Modified of the response the content was extracted from
 
         Returns
         -------
-        WatchLog
-            The newly created watchlog
+        dict[str, Any]
+            Column values of the new watchlog
         """
-        self.logger.info(f"Creating new watchlog for source {source_uuid}")
-        watchlog_data = WatchLogCreate(source_uuid=source_uuid, previous_uuid=previous_uuid, content_hash=content_hash)
+        return {
+            "uuid": uuid4(),
+            "source_uuid": source_uuid,
+            "previous_uuid": previous_uuid,
+            "content_hash": content_hash,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+
+    async def _insert_changes(self, changes: Sequence[_ContentChange]) -> list[Article]:
+        """Insert the watchlogs and articles of detected changes in a single transaction.
+
+        Rows of each table are batched into executemany ``INSERT ... RETURNING`` statements, so
+        server defaults come back without a refresh.
+
+        Parameters
+        ----------
+        changes : Sequence[_ContentChange]
+            The detected changes to store
 
-        watchlog = WatchLog(**watchlog_data.model_dump())
-        self.session.add(watchlog)
+        Returns
+        -------
+        list[Article]
+            The inserted articles, in the order of `changes`
+        """
+        self.logger.debug("Inserting %s new watchlogs and articles", len(changes))
+        watchlogs = (
+            await self.session.execute(
+                insert(WatchLog).returning(WatchLog, sort_by_parameter_order=True),
+                params=[change.watchlog for change in changes],
+            )
+        ).scalars()
+        states = [_WatchState.from_watchlog(watchlog) for watchlog in watchlogs]
+        articles = list(
+            (
+                await self.session.execute(
+                    insert(Article).returning(Article, sort_by_parameter_order=True),
+                    params=[change.article for change in changes],
+                )
+            ).scalars()
+        )
         await self.session.commit()
-        await self.session.refresh(watchlog)
-        self.logger.info(f"Created watchlog {watchlog.uuid}")
-        return watchlog
+
+        for change, state, article in zip(changes, states, articles, strict=True):
+            self._seen[change.source_uuid] = state
+            self.logger.info("Created watchlog %s and article %s: %s", state.watchlog_uuid, article.uuid, article.title)
+        return articles
 
     async def get_source(self, source_uuid: UUID) -> Source:
         """Get a source by its UUID.
@@ -299,17 +608,15 @@ class CheckSourceService:
         Optional[Source]
             The source object, or None if not found
         """
-        self.logger.debug(f"Fetching source {source_uuid}")
-        stmt = select(Source).where(Source.uuid == source_uuid)
-        result = await self.session.exec(stmt)
+        self.logger.debug("Fetching source %s", source_uuid)
+        result = await self.session.exec(_SOURCE_BY_UUID, params={"uuid": source_uuid})
         source = result.one_or_none()
 
         if source is None:
-            self.logger.error(f"Source {source_uuid} not found or not active")
+            self.logger.error("Source %s not found or not active", source_uuid)
             raise HTTPException(status_code=404, detail="Source not found")
         else:
-            await self.session.refresh(source)
-            self.logger.debug(f"Found source {source.uuid}: {source.uri}")
+            self.logger.debug("Found source %s: %s", source.uuid, source.uri)
 
         return source
 
@@ -327,12 +634,55 @@ class CheckSourceService:
         sources = result.all()
 
         if sources:
-            self.logger.info(f"Found {len(sources)} active sources")
+            self.logger.info("Found %s active sources", len(sources))
         else:
             self.logger.info("No active sources found")
 
         return list(sources)
 
+    async def get_sources_by_uuids(self, source_uuids: Sequence[UUID]) -> dict[UUID, Source]:
+        """Get several active sources in a single query.
+
+        Parameters
+        ----------
+        source_uuids : Sequence[UUID]
+            UUIDs of the sources to get
+
+        Returns
+        -------
+        dict[UUID, Source]
+            The found sources by UUID. Missing or inactive sources are left out.
+        """
+        self.logger.debug("Fetching %s sources", len(source_uuids))
+        stmt = select(Source).where(col(Source.uuid).in_(source_uuids), Source.active).options(raiseload("*"))
+        result = await self.session.exec(stmt)
+        return {source.uuid: source for source in result}
+
+    async def _load_state(self, source_uuid: UUID) -> _WatchState | None:
+        """Load the latest watchlog state of a source from the database and cache it."""
+        watchlog = await self.get_latest_watchlog(source_uuid)
+        if watchlog is None:
+            self._seen.pop(source_uuid, None)
+            return None
+
+        state = self._seen[source_uuid] = _WatchState.from_watchlog(watchlog)
+        return state
+
+    async def _update_validators(self, source_uuid: UUID, state: _WatchState, fetched: FetchedContent) -> None:
+        """Store new HTTP validators on the latest watchlog when the content itself is unchanged."""
+        if (state.etag, state.last_modified) != (fetched.etag, fetched.last_modified):
+            self.logger.debug("Updating cache validators of watchlog %s", state.watchlog_uuid)
+            stmt = (
+                update(WatchLog)
+                .where(col(WatchLog.uuid) == state.watchlog_uuid)
+                .values(etag=fetched.etag, last_modified=fetched.last_modified)
+            )
+            await self.session.execute(stmt)
+            await self.session.commit()
+            state = replace(state, etag=fetched.etag, last_modified=fetched.last_modified)
+
+        self._seen[source_uuid] = state
+
     async def check_source(self, source_uuid: UUID) -> Article | None:
         """Check a source for new content and create an article if content has changed.
 
@@ -351,43 +701,167 @@ class CheckSourceService:
         HTTPException
             If source not found or errors occur during processing
         """
-        self.logger.info(f"Checking source {source_uuid} for changes")
         source = await self.get_source(source_uuid)
+        return await self.check_source_obj(source)
+
+    async def check_source_obj(self, source: Source) -> Article | None:
+        """Check an already loaded source for new content and create an article if content has changed.
+
+        Only column attributes of the source are used, so it may have been loaded by another session.
+
+        Parameters
+        ----------
+        source : Source
+            The source to check
+
+        Returns
+        -------
+        Optional[Article]
+            Newly created article if content changed, None otherwise
+
+        Raises
+        ------
+        HTTPException
+            If errors occur during processing
+        """
+        change = await self._detect_change(source)
+        if change is None:
+            return None
+        (article,) = await self._insert_changes([change])
+        return article
+
+    async def _detect_change(self, source: Source) -> _ContentChange | None:
+        """Fetch a source and build the rows to insert if its content has changed.
+
+        Unchanged sources only get the HTTP validators of their latest watchlog refreshed.
+
+        Parameters
+        ----------
+        source : Source
+            The source to check
+
+        Returns
+        -------
+        Optional[_ContentChange]
+            The rows to insert if content changed, None otherwise
+        """
+        source_uuid = source.uuid
+        self.logger.info("Checking source %s for changes", source_uuid)
 
         source_uri = source.uri
         selector = source.watchable_selector or ""
         selector_type = source.watchable_selector_type or WatchableSelectorType.CSS
 
-        raw_content = await self.fetch_content(source_uri)
+        state = self._seen.get(source_uuid)
+        from_cache = state is not None
+        if state is None:
+            state = await self._load_state(source_uuid)
+
+        # End the read transaction, so no pooled connection is held while the source is fetched.
+        await self.session.commit()
+
+        fetched = await self.fetch_content(
+            source_uri,
+            etag=state.etag if state else None,
+            last_modified=state.last_modified if state else None,
+        )
+        if fetched is None:
+            self.logger.info("No content changes detected for source %s", source_uuid)
+            return None
+
+        raw_content = fetched.content
         extracted_content = self.extract_content(
             content=raw_content,
             selector=selector,
             selector_type=selector_type,
+            encoding=fetched.encoding,
         )
 
-        content_hash = self.calculate_hash(extracted_content)
-        self.logger.debug(f"Content hash: {content_hash}")
+        # Without a selector the extracted content is the whole body, which was already hashed while downloading.
+        content_hash = self.calculate_hash(extracted_content) if selector else fetched.content_hash
+        self.logger.debug("Content hash: %s", content_hash)
 
-        latest_watchlog = await self.get_latest_watchlog(source_uuid)
+        # The cache does not see watchlogs written by other services, so confirm a change with the database.
+        if from_cache and state and state.content_hash != content_hash:
+            state = await self._load_state(source_uuid)
 
-        previous_hash = None
-        if latest_watchlog:
-            previous_hash = latest_watchlog.content_hash
+        # Watchlogs are only written when the content changes, unchanged checks at most refresh the validators.
+        if state and state.content_hash == content_hash:
+            self.logger.info("No content changes detected for source %s", source_uuid)
+            await self._update_validators(source_uuid, state, fetched)
+            return None
 
-        new_watchlog = await self.create_watchlog(
+        self.logger.info("Content changed for source %s, creating new article", source_uuid)
+        watchlog = self._watchlog_values(
             source_uuid=source_uuid,
-            previous_uuid=latest_watchlog.uuid if latest_watchlog else None,
+            previous_uuid=state.watchlog_uuid if state else None,
             content_hash=content_hash,
+            etag=fetched.etag,
+            last_modified=fetched.last_modified,
+        )
+        article = self._article_values(
+            watchlog_uuid=watchlog["uuid"],
+            source_uri=source_uri,
+            extracted_content=extracted_content,
         )
+        return _ContentChange(source_uuid=source_uuid, watchlog=watchlog, article=article)
 
-        if previous_hash is None or previous_hash != content_hash:
-            self.logger.info(f"Content changed for source {source_uuid}, creating new article")
-            article = await self.create_article(
-                watchlog_uuid=new_watchlog.uuid,
-                source_uri=source_uri,
-                extracted_content=extracted_content,
-            )
-            return article
-        else:
-            self.logger.info(f"No content changes detected for source {source_uuid}")
-            return None
+    async def check_many(
+        self, sources: Sequence[UUID | Source], concurrency: int | None = None
+    ) -> list[Article | None | BaseException]:
+        """Check several sources concurrently.
+
+        Changes are detected concurrently, every source in its own session, since a session cannot
+        be shared between concurrently running tasks. All checks share the service's HTTP client.
+        The watchlogs and articles of all changed sources are then stored in a single transaction.
+
+        Parameters
+        ----------
+        sources : Sequence[UUID | Source]
+            Sources to check, either as UUIDs or as already loaded sources, which are not read again
+        concurrency : int, optional
+            Maximum number of sources checked at once, by default `config.check_source_concurrency`
+
+        Returns
+        -------
+        list[Article | None | BaseException]
+            Check result for every source, in the order of `sources`. Failed checks
+            are returned as their exception instead of being raised. Sources given more
+            than once are checked once and share their result.
+        """
+        semaphore = asyncio.Semaphore(concurrency or config.check_source_concurrency)
+
+        async def detect_one(source: UUID | Source) -> _ContentChange | None:
+            async with semaphore, async_sessionmaker() as session:
+                service = self.with_session(session)
+                if not isinstance(source, Source):
+                    source = await service.get_source(source)
+                return await service._detect_change(source)
+
+        # A source listed more than once is checked once, so its change is not stored twice.
+        keys = [source.uuid if isinstance(source, Source) else source for source in sources]
+        unique: dict[UUID, UUID | Source] = {}
+        for key, source in zip(keys, sources, strict=True):
+            unique.setdefault(key, source)
+
+        self.logger.info("Checking %s sources", len(unique))
+        results: list[Any] = await asyncio.gather(
+            *(detect_one(source) for source in unique.values()), return_exceptions=True
+        )
+
+        changed = [i for i, result in enumerate(results) if isinstance(result, _ContentChange)]
+        if changed:
+            try:
+                async with async_sessionmaker() as session:
+                    stored: Sequence[Article | BaseException] = await self.with_session(session)._insert_changes(
+                        [results[i] for i in changed]
+                    )
+            except Exception as e:
+                self.logger.exception("Error storing changes of %s sources: %s", len(changed), e)
+                stored = [e] * len(changed)
+
+            for i, article in zip(changed, stored, strict=True):
+                results[i] = article
+
+        by_uuid = dict(zip(unique, results, strict=True))
+        return [by_uuid[key] for key in keys]
@@ -10,6 +10,12 @@ class Config(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="puteus_", env_file=".env", extra="ignore")
 
     db_uri: AnyUrl = AnyUrl("sqlite+aiosqlite:///db.sqlite")
+    db_pool_size: Annotated[
+        int, Field(description="Number of database connections kept open in the connection pool.", gt=0)
+    ] = 5
+    db_max_overflow: Annotated[
+        int, Field(description="Number of extra database connections opened on demand under load.", ge=0)
+    ] = 10
     debug: bool = False
     dev_drop_db: bool = False
 
@@ -20,6 +26,12 @@ class Config(BaseSettings):
     check_source_interval: Annotated[
         int, Field(description="Interval in seconds to check sources for new content.", gt=0)
     ] = 60 * 5  # 5 minutes
+    check_source_concurrency: Annotated[
+        int, Field(description="Maximum number of sources checked concurrently.", gt=0)
+    ] = 16
+    max_content_bytes: Annotated[
+        int, Field(description="Maximum size in bytes of a source response body, larger bodies are rejected.", gt=0)
+    ] = 8 * 1024 * 1024  # 8 MiB
 
     @field_validator("dev_drop_db", mode="after")
     @classmethod
@@ -1,18 +1,78 @@
 import logging
 from collections.abc import AsyncGenerator
+from typing import cast
 
+from sqlalchemy import Connection, QueuePool, event, inspect, make_url, text
+from sqlalchemy.engine.default import DefaultDialect
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.ext.asyncio.session import async_sessionmaker
+from sqlalchemy.ext.asyncio.session import async_sessionmaker as _async_sessionmaker
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .config import config
 
-async_engine = create_async_engine(config.db_uri, future=True)
-async_sessionmaker = async_sessionmaker(async_engine, expire_on_commit=False, class_=AsyncSession)
+# The pool size is tunable per deployment, the defaults match SQLAlchemy's. Only queue pools are sized,
+# in-memory SQLite for example uses a single static connection.
+_db_url = make_url(config.db_uri)
+_pool_kwargs = (
+    {"pool_size": config.db_pool_size, "max_overflow": config.db_max_overflow}
+    if issubclass(cast("type[DefaultDialect]", _db_url.get_dialect()).get_pool_class(_db_url), QueuePool)
+    else {}
+)
+async_engine = create_async_engine(config.db_uri, future=True, **_pool_kwargs)
+async_sessionmaker = _async_sessionmaker(async_engine, expire_on_commit=False, class_=AsyncSession)
 
 logger = logging.getLogger(__name__)
 
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+
+
+if async_engine.dialect.name == "sqlite":
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Tune every new SQLite connection for concurrent reads during the poller's writes."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+# Nullable columns added to existing tables after their first release. `create_all` only creates missing
+# tables, so these are added to databases created before them by `_add_missing_columns`.
+_ADDED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "watchlog": ("etag", "last_modified"),
+}
+
+
+def _add_missing_columns(connection: Connection) -> None:
+    """Add the columns listed in `_ADDED_COLUMNS` to existing tables that lack them."""
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    for table_name, column_names in _ADDED_COLUMNS.items():
+        table = SQLModel.metadata.tables.get(table_name)
+        if table is None or not inspector.has_table(table_name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        for column_name in column_names:
+            if column_name in existing:
+                continue
+            column = table.c[column_name]
+            logger.warning("Adding missing column %s.%s", table_name, column_name)
+            connection.execute(
+                text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=connection.dialect)}"
+                )
+            )
+
 
 async def init_db():
     async with async_engine.begin() as conn:
@@ -20,10 +80,11 @@ async def init_db():
             logger.warning("!!! - Dropping Database - !!!")
             await conn.run_sync(SQLModel.metadata.drop_all)
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSession(async_engine) as session:
+    async with async_sessionmaker() as session:
         try:
             yield session
             await session.commit()
@@ -1,12 +1,11 @@
-from asyncio import run
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from . import tasks
 from .admin import register_admin
@@ -15,12 +14,14 @@ from .config import config
 from .db import async_sessionmaker, init_db
 from .routers import check_source, models
 
-scheduler = BackgroundScheduler()
+# Jobs run on the application's event loop, so HTTP and database pools stay warm between runs.
+scheduler = AsyncIOScheduler()
 check_source_service = CheckSourceService(session=async_sessionmaker())
 
 scheduler.add_job(
-    lambda: run(tasks.check_all_sources(check_source_service)),
+    tasks.check_all_sources,
     IntervalTrigger(seconds=config.check_source_interval),
+    args=[check_source_service],
     id="check_all_sources",
     name="Check all sources for new content",
     replace_existing=True,
@@ -31,10 +32,13 @@ scheduler.add_job(
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, Any]:
     try:
         await init_db()
+        # Request handlers derive their services from this one, sharing its HTTP client and watchlog cache.
+        app.state.check_source_service = check_source_service
         scheduler.start()
         yield
     finally:
         scheduler.shutdown()
+        await check_source_service.aclose()
 
 
 app = FastAPI(
@@ -43,6 +47,7 @@ app = FastAPI(
     title=config.app_name,
     description=config.app_description,
     version=config.app_version,
+    default_response_class=ORJSONResponse,
 )
 app.include_router(models.router, prefix="/api/v1/data")
 app.include_router(check_source.router, prefix="/api/v1/check-source")
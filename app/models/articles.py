@@ -20,6 +20,12 @@ class WatchLogCreate(SQLCreate):
         description="The hash of the content of the article. Used to check if the article has changed.",
         nullable=True,
     )
+    etag: str | None = Field(
+        None, description="The ETag header of the response the content was fetched from.", nullable=True
+    )
+    last_modified: str | None = Field(
+        None, description="The Last-Modified header of the response the content was fetched from.", nullable=True
+    )
 
 
 class WatchLogPublic(WatchLogCreate, SQLPublic): ...
@@ -0,0 +1,49 @@
+"""
+ISO country and language code types.
+
+The sets of valid codes are built from pycountry once at import, so validation is a single set lookup.
+"""
+
+from typing import Annotated
+
+import pycountry
+from pydantic import AfterValidator, StringConstraints, WithJsonSchema
+from pydantic_core import PydanticCustomError
+
+# pycountry records expose their codes as dynamic attributes, and not every language has an alpha-2 code.
+_COUNTRY_ALPHA3: frozenset[str] = frozenset(
+    code for country in pycountry.countries if (code := getattr(country, "alpha_3", None))
+)
+_LANGUAGE_ALPHA2: frozenset[str] = frozenset(
+    code for language in pycountry.languages if (code := getattr(language, "alpha_2", None))
+)
+
+
+def _validate_country_alpha3(value: str) -> str:
+    if value not in _COUNTRY_ALPHA3:
+        raise PydanticCustomError("country_alpha3", "Invalid country alpha3 code")
+    return value
+
+
+def _validate_language_alpha2(value: str) -> str:
+    if value not in _LANGUAGE_ALPHA2:
+        raise PydanticCustomError("language_alpha2", "Invalid language alpha2 code")
+    return value
+
+
+# The pattern is only documented in the JSON schema, so a malformed code fails the set lookup with its own error type.
+CountryAlpha3 = Annotated[
+    str,
+    StringConstraints(to_upper=True),
+    AfterValidator(_validate_country_alpha3),
+    WithJsonSchema({"type": "string", "pattern": r"^\w{3}$"}),
+]
+"""Country code in the ISO 3166-1 alpha-3 format, e.g. `USA`."""
+
+LanguageAlpha2 = Annotated[
+    str,
+    StringConstraints(to_lower=True),
+    AfterValidator(_validate_language_alpha2),
+    WithJsonSchema({"type": "string", "pattern": r"^\w{2}$"}),
+]
+"""Language code in the ISO 639-1 alpha-2 format, e.g. `en`."""
@@ -1,16 +1,18 @@
-from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Self
 from uuid import UUID
 
+import sqlalchemy as sa
 from fastapi import HTTPException
-from pydantic import BaseModel
-from sqlmodel import select
+from sqlmodel import col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
 from .base import SQLCreate, SQLPublic, SQLTable
 
 
-class ModelContainer(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ModelContainer:
     """A container class holding SQLAlchemy model-related classes.
 
     This class serves as a container for related SQLAlchemy model classes, including the main table class,
@@ -23,6 +25,7 @@ class ModelContainer(BaseModel):
     table (type[SQLTable]): The main SQLAlchemy table model class
     public (type[SQLPublic]): The public representation class of the model
     create (type[SQLCreate]): The creation schema class for the model
+    read_all_statement (SelectOfScalar[SQLTable]): Prebuilt statement selecting all active records of the table
 
     Class Methods
     -------------
@@ -40,6 +43,7 @@ class ModelContainer(BaseModel):
     table: type[SQLTable]
     public: type[SQLPublic]
     create: type[SQLCreate]
+    read_all_statement: SelectOfScalar[SQLTable]
 
     @classmethod
     def from_table(cls, table: type[SQLTable]) -> Self:
@@ -53,7 +57,30 @@ class ModelContainer(BaseModel):
             raise ValueError(f"No create class found for public class {public.__name__}")
         create = create_classes[0]
 
-        return cls(table=table, public=public, create=create)
+        return cls(table=table, public=public, create=create, read_all_statement=select(table).where(table.active))
+
+
+# Table classes are not `Hashable` to type checkers, so the containers are cached in a plain dict.
+_MODEL_CONTAINERS: dict[type[SQLTable], ModelContainer] = {}
+
+
+def get_model_container(table: type[SQLTable]) -> ModelContainer:
+    """Get the ModelContainer of a table class, creating it on first use.
+
+    Parameters
+    ----------
+    table : type[SQLTable]
+        The SQLModel table class
+
+    Returns
+    -------
+    ModelContainer
+        The cached container of the table and its related classes
+    """
+    container = _MODEL_CONTAINERS.get(table)
+    if container is None:
+        container = _MODEL_CONTAINERS[table] = ModelContainer.from_table(table=table)
+    return container
 
 
 class ModelService:
@@ -73,7 +100,7 @@ class ModelService:
         self.table = table
         self.session = session
 
-        self.models = ModelContainer.from_table(table=self.table)
+        self.models = get_model_container(self.table)
 
     async def create(self, data: SQLCreate) -> SQLTable:
         """
@@ -82,21 +109,21 @@ class ModelService:
         Parameters
         ----------
         data : SQLCreate
-            The data to create the new record with. Must be a Pydantic model instance
-            with model_dump() method.
+            The data to create the new record with. Must be a validated Pydantic model instance.
 
         Returns
         -------
         SQLTable
             The newly created database record.
         """
-        model = self.models.table(**data.model_dump())
+        # `data` is already validated and table models do not validate on init, so a shallow field copy is enough.
+        model = self.models.table(**dict(data))
         self.session.add(model)
         await self.session.commit()
         await self.session.refresh(model)
         return model
 
-    async def read_all(self, offset: int = 0, limit: int | None = None) -> Sequence[SQLTable]:
+    async def read_all(self, offset: int = 0, limit: int | None = None) -> list[SQLTable]:
         """Retrieve all active records from the database with pagination.
 
         Parameters
@@ -108,15 +135,15 @@ class ModelService:
 
         Returns
         -------
-        Sequence[SQLTable]
-            A sequence of active database records of the specified table type
+        list[SQLTable]
+            A list of active database records of the specified table type
 
         Notes
         -----
         Only retrieves records where the `active` flag is `True`.
         """
-        stmt = select(self.models.table).where(self.models.table.active).offset(offset).limit(limit)
-        return (await self.session.exec(stmt)).all()
+        stmt = self.models.read_all_statement.offset(offset).limit(limit)
+        return list((await self.session.exec(stmt)).all())
 
     async def read(self, uuid: UUID) -> SQLTable | None:
         """
@@ -132,8 +159,9 @@ class ModelService:
         SQLTable or None
             The retrieved record if found and active, None otherwise.
         """
-        stmt = select(self.models.table).where(self.models.table.uuid == uuid, self.models.table.active)
-        return (await self.session.exec(stmt)).one_or_none()
+        # Looked up by primary key, so records already in the session's identity map need no query.
+        model = await self.session.get(self.models.table, uuid)
+        return model if model is not None and model.active else None
 
     async def update(self, data: SQLPublic) -> SQLTable:
         """
@@ -154,11 +182,19 @@ class ModelService:
         HTTPException
             If no model is found with the given UUID (404).
         """
-        model = await self.read(uuid=data.uuid)
+        # Only fields sent by the client are written, omitted fields keep their stored values.
+        values = data.model_dump(exclude={"uuid"}, exclude_unset=True)
+        if not values:
+            model = await self.read(uuid=data.uuid)
+            if model is None:
+                raise HTTPException(status_code=404, detail="Model not found")
+            return model
+
+        table = self.models.table
+        stmt = update(table).where(col(table.uuid) == data.uuid, col(table.active)).values(**values).returning(table)
+        model = (await self.session.execute(stmt)).scalar_one_or_none()
         if model is None:
             raise HTTPException(status_code=404, detail="Model not found")
-        model.sqlmodel_update(data.model_dump())
-        self.session.add(model)
         await self.session.commit()
         return model
 
@@ -181,10 +217,16 @@ class ModelService:
         HTTPException
             If model with given UUID is not found (404).
         """
-        model = await self.read(uuid=uuid)
+        table = self.models.table
+        # Set `deleted_at` directly, the soft deletion listener does not run for UPDATE statements.
+        stmt = (
+            update(table)
+            .where(col(table.uuid) == uuid, col(table.active))
+            .values(active=False, deleted_at=sa.func.now())
+            .returning(table)
+        )
+        model = (await self.session.execute(stmt)).scalar_one_or_none()
         if model is None:
             raise HTTPException(status_code=404, detail="Model not found")
-        model.sqlmodel_update({"active": False})
-        self.session.add(model)
         await self.session.commit()
         return model
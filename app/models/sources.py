@@ -1,12 +1,11 @@
 import enum
 import uuid
 
-from pydantic_extra_types import country as pydantic_country
-from pydantic_extra_types import language_code as pydantic_lang
 from sqlmodel import AutoString, Field, Relationship
 
 from .articles import WatchLog
 from .base import SQLCreate, SQLPublic, SQLTable
+from .locales import CountryAlpha3, LanguageAlpha2
 from .urls import AnyUrl
 
 
@@ -14,7 +13,7 @@ class SiteCreate(SQLCreate):
     url: AnyUrl = Field(..., description="The home URL of the site", sa_type=AutoString)
     name: str = Field(..., description="The name of the site")
     description: str | None = Field(None, description="The description of the site", nullable=True)
-    country: pydantic_country.CountryAlpha3 | None = Field(
+    country: CountryAlpha3 | None = Field(
         None,
         description="The country of the site in ISO 3166-1 alpha-3 format",
         nullable=True,
@@ -45,7 +44,7 @@ class WatchableSelectorType(enum.StrEnum):
 class SourceCreate(SQLCreate):
     site_uuid: uuid.UUID | None = Field(None, foreign_key="site.uuid", description="The site ID")
     type: SourceType = Field(..., description="The type of the source")
-    locale: pydantic_lang.LanguageAlpha2 | None = Field(
+    locale: LanguageAlpha2 | None = Field(
         None,
         nullable=True,
         description="The locale of the source in ISO 639-1 alpha-2 format",
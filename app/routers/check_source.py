@@ -1,13 +1,15 @@
 import logging
+from collections.abc import Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
 from pydantic import BaseModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ..check_source import CheckSourceService
+from ..check_source import CheckSourceService, log_check_error
 from ..db import get_async_session
 from ..models.articles import Article
+from ..models.sources import Source
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +25,19 @@ class ArticleOrError(BaseModel):
     message: str | None = None
 
 
-async def get_check_source_service(session: AsyncSession = Depends(get_async_session)) -> CheckSourceService:
+async def get_check_source_service(
+    request: Request,
+    session: AsyncSession = Depends(get_async_session),
+) -> CheckSourceService:
     """Get an instance of the CheckSourceService.
 
+    The service is bound to the request's session and shares the HTTP client and watchlog cache
+    of the application's service, which is closed at shutdown.
+
     Parameters
     ----------
+    request : Request
+        The current request, giving access to the application state
     session : AsyncSession
         The database session from dependency
 
@@ -36,54 +46,78 @@ async def get_check_source_service(session: AsyncSession = Depends(get_async_ses
     CheckSourceService
         An instance of CheckSourceService
     """
-    return CheckSourceService(session=session)
+    return request.app.state.check_source_service.with_session(session)
 
 
-@router.post(
-    "/batch",
-    response_model=list[ArticleOrError],
-    status_code=status.HTTP_200_OK,
-)
-async def check_multiple_sources(
-    source_uuids: list[UUID] = Query(..., description="List of source UUIDs to check"),
-    service: CheckSourceService = Depends(get_check_source_service),
-) -> list[ArticleOrError]:
-    """
-    Check multiple sources for new content and create articles for changed content.
+async def _check_batch(service: CheckSourceService, sources: Sequence[UUID | Source]) -> list[ArticleOrError]:
+    """Check sources concurrently and map every result to an `ArticleOrError`.
 
-    Empty article indicates no content changes detected.
-    """
-    logger.info(f"API request to check {len(source_uuids)} sources")
+    Parameters
+    ----------
+    service : CheckSourceService
+        The service to check the sources with
+    sources : Sequence[UUID | Source]
+        Sources to check, either as UUIDs or as already loaded sources
 
+    Returns
+    -------
+    list[ArticleOrError]
+        Result for every source, in the order of `sources`
+
+    Raises
+    ------
+    HTTPException
+        If all source checks failed
+    """
     response: list[ArticleOrError] = []
 
-    for source_uuid in source_uuids:
-        try:
-            article = await service.check_source(source_uuid=source_uuid)
-            if article:
-                response.append(ArticleOrError(source_uuid=source_uuid, article=article, error=None))
-            else:
-                response.append(
-                    ArticleOrError(source_uuid=source_uuid, article=None, message="No content changes detected")
-                )
-        except Exception as e:
-            logger.exception(f"Error checking source {source_uuid}: {str(e)}")
-            response.append(ArticleOrError(source_uuid=source_uuid, article=None, error=str(e)))
+    # Sources are checked concurrently, each in its own session.
+    for source, result in zip(sources, await service.check_many(sources), strict=True):
+        source_uuid = source.uuid if isinstance(source, Source) else source
+        if isinstance(result, BaseException):
+            log_check_error(logger, source_uuid, result)
+            response.append(ArticleOrError(source_uuid=source_uuid, article=None, error=str(result)))
+        elif result:
+            response.append(ArticleOrError(source_uuid=source_uuid, article=result, error=None))
+        else:
+            response.append(
+                ArticleOrError(source_uuid=source_uuid, article=None, message="No content changes detected")
+            )
 
     articles = [item.article for item in response if item.article]
     errors = [item.error for item in response if item.error]
 
-    if len(errors) == len(source_uuids):
+    if len(errors) == len(sources):
         logger.error("All source checks failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"message": "All source checks failed", "errors": [r.model_dump(mode="json") for r in response]},
         )
 
-    logger.info(f"Batch check completed. Created {len(articles)} articles, encountered {len(errors)} errors")
+    logger.info("Batch check completed. Created %s articles, encountered %s errors", len(articles), len(errors))
     return response
 
 
+@router.post(
+    "/batch",
+    response_model=list[ArticleOrError],
+    status_code=status.HTTP_200_OK,
+)
+async def check_multiple_sources(
+    source_uuids: list[UUID] = Query(..., description="List of source UUIDs to check"),
+    service: CheckSourceService = Depends(get_check_source_service),
+) -> list[ArticleOrError]:
+    """
+    Check multiple sources for new content and create articles for changed content.
+
+    Empty article indicates no content changes detected.
+    """
+    logger.info("API request to check %s sources", len(source_uuids))
+    # Sources are loaded in one query, missing ones are still checked by UUID to report them as not found.
+    found = await service.get_sources_by_uuids(source_uuids)
+    return await _check_batch(service, [found.get(source_uuid, source_uuid) for source_uuid in source_uuids])
+
+
 @router.post(
     "/batch/all",
     response_model=list[ArticleOrError],
@@ -96,9 +130,8 @@ async def check_all_sources(
     Check all sources for new content and create articles for changed content.
     """
     logger.info("API request to check all sources")
-    source_uuids = [source.uuid for source in await service.get_all_sources()]
-
-    return await check_multiple_sources(source_uuids=source_uuids, service=service)
+    # The listed sources are checked as they are, without being read again one by one.
+    return await _check_batch(service, await service.get_all_sources())
 
 
 @router.post(
@@ -117,7 +150,7 @@ async def check_source_endpoint(
     service: CheckSourceService = Depends(get_check_source_service),
 ) -> Article:
     """Check a source for new content and create an article if content has changed."""
-    logger.info(f"API request to check source {source_uuid}")
+    logger.info("API request to check source %s", source_uuid)
 
     try:
         article = await service.check_source(source_uuid=source_uuid)
@@ -131,7 +164,7 @@ async def check_source_endpoint(
         raise
 
     except Exception as e:
-        logger.exception(f"Unexpected error checking source {source_uuid}: {str(e)}")
+        logger.exception("Unexpected error checking source %s: %s", source_uuid, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error checking source: {str(e)}"
         ) from e
@@ -1,17 +1,18 @@
-from collections.abc import Callable, Coroutine, Sequence
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from enum import Enum
 from typing import Annotated, Any, Self
 from uuid import UUID
 
 import starlette.status as http_status
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..db import get_async_session
 from ..models import articles, sources
 from ..models.base import SQLCreate, SQLPublic, SQLTable
-from ..models.model_service import ModelContainer, ModelService
+from ..models.model_service import ModelService, get_model_container
 
 ModelServiceFactory = Callable[[AsyncSession], Coroutine[Any, Any, ModelService]]
 
@@ -23,9 +24,10 @@ def get_model_service(table: type[SQLTable]) -> ModelServiceFactory:
     return fn
 
 
-class ModelEndpointConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ModelEndpointConfig:
     """
-    Pydantic model configuration class for FastAPI endpoints that interact with SQLAlchemy models.
+    Configuration class for FastAPI endpoints that interact with SQLAlchemy models.
 
     This class provides configuration for creating RESTful API endpoints that handle database operations
     for a specific SQLAlchemy model.
@@ -44,6 +46,10 @@ class ModelEndpointConfig(BaseModel):
         Service factory class handling database operations.
     tags : list[str | Enum]
         List of tags for API documentation grouping.
+    item_adapter : TypeAdapter
+        Adapter serializing a single record as `response_model`.
+    list_adapter : TypeAdapter
+        Adapter serializing a list of records as `response_model`.
 
     Methods
     -------
@@ -57,6 +63,8 @@ class ModelEndpointConfig(BaseModel):
     response_model: type[SQLPublic]
     service: ModelServiceFactory
     tags: list[str | Enum]
+    item_adapter: TypeAdapter
+    list_adapter: TypeAdapter
 
     @classmethod
     def from_table(cls, table: type[SQLTable], tags: list[str | Enum] | None = None) -> Self:
@@ -74,7 +82,7 @@ class ModelEndpointConfig(BaseModel):
         Self
             An instance of ModelEndpointConfig.
         """
-        models_ = ModelContainer.from_table(table=table)
+        models_ = get_model_container(table)
         return cls(
             path=f"/{models_.table.__tablename__}",
             table=models_.table,
@@ -82,89 +90,81 @@ class ModelEndpointConfig(BaseModel):
             response_model=models_.public,
             service=get_model_service(models_.table),
             tags=tags if tags is not None else [str(models_.table.__tablename__)],
+            item_adapter=TypeAdapter(models_.public),
+            list_adapter=TypeAdapter(list[models_.public]),
         )
 
 
-def add_create_model_endpoint(
+def add_model_endpoints(
     router_: APIRouter, config_: ModelEndpointConfig, decorator_extra_kwargs: dict | None = None
 ) -> None:
-    @router_.put(
-        path=config_.path,
-        response_model=config_.response_model,
-        status_code=http_status.HTTP_201_CREATED,
-        tags=config_.tags,
-        **(decorator_extra_kwargs or {}),
-    )
+    """Register the create, read all, read, update and delete endpoints of a model.
+
+    The endpoints are annotated with the concrete models of `config_`, so FastAPI builds
+    their request parsing and dependencies once, when the routes are added.
+
+    Parameters
+    ----------
+    router_ : APIRouter
+        The router to add the endpoints to.
+    config_ : ModelEndpointConfig
+        Configuration of the model to add the endpoints for.
+    decorator_extra_kwargs : dict, optional
+        Extra keyword arguments passed to every `APIRouter.add_api_route` call.
+    """
+
+    # The body models are only known at runtime. FastAPI reads them from the annotations, which type checkers
+    # cannot follow, hence the targeted ignores.
     async def create(
-        response: Response, data: Annotated[SQLCreate, config_.create], service: ModelService = Depends(config_.service)
+        response: Response,
+        data: config_.create,  # pyright: ignore[reportInvalidTypeForm]
+        service: ModelService = Depends(config_.service),
     ) -> SQLTable:
         created = await service.create(data=data)
         response.headers["Location"] = f"{router_.prefix}{config_.path}/{created.uuid}"
         return created
 
-
-def add_read_all_model_endpoint(
-    router_: APIRouter, config_: ModelEndpointConfig, decorator_extra_kwargs: dict | None = None
-) -> None:
-    @router_.get(
-        path=config_.path,
-        response_model=list[config_.response_model],
-        status_code=http_status.HTTP_200_OK,
-        tags=config_.tags,
-        **(decorator_extra_kwargs or {}),
-    )
     async def read_all(
         service: ModelService = Depends(config_.service), offset: int = 0, limit: Annotated[int, Query(le=100)] = 100
-    ) -> Sequence[SQLTable]:
-        return await service.read_all(limit=limit, offset=offset)
-
+    ) -> Response:
+        rows = await service.read_all(limit=limit, offset=offset)
+        # Rows are serialized straight to JSON, `response_model` is kept for the OpenAPI schema only.
+        return Response(content=config_.list_adapter.dump_json(rows), media_type="application/json")
 
-def add_read_model_endpoint(
-    router_: APIRouter, config_: ModelEndpointConfig, decorator_extra_kwargs: dict | None = None
-) -> None:
-    @router_.get(
-        path=f"{config_.path}/{{uuid}}",
-        response_model=config_.response_model,
-        status_code=http_status.HTTP_200_OK,
-        tags=config_.tags,
-        **(decorator_extra_kwargs or {}),
-    )
-    async def read(
-        uuid: Annotated[UUID, Depends(config_.service)], service: ModelService = Depends(config_.service)
-    ) -> SQLTable:
+    async def read(uuid: UUID, service: ModelService = Depends(config_.service)) -> Response:
         entity = await service.read(uuid=uuid)
         if entity is None:
             raise HTTPException(status_code=404, detail="Model not found")
-        return entity
-
+        return Response(content=config_.item_adapter.dump_json(entity), media_type="application/json")
 
-def add_update_model_endpoint(
-    router_: APIRouter, config_: ModelEndpointConfig, decorator_extra_kwargs: dict | None = None
-) -> None:
-    @router_.patch(
-        path=config_.path,
-        response_model=config_.response_model,
-        status_code=http_status.HTTP_200_OK,
-        tags=config_.tags,
-        **(decorator_extra_kwargs or {}),
-    )
-    async def update(data: SQLPublic, service: ModelService = Depends(config_.service)):
+    async def update(
+        data: config_.response_model,  # pyright: ignore[reportInvalidTypeForm]
+        service: ModelService = Depends(config_.service),
+    ) -> SQLTable:
         return await service.update(data=data)
 
-
-def add_delete_model_endpoint(
-    router_: APIRouter, config_: ModelEndpointConfig, decorator_extra_kwargs: dict | None = None
-) -> None:
-    @router_.delete(
-        path=f"{config_.path}/{{uuid}}",
-        response_model=config_.response_model,
-        status_code=http_status.HTTP_200_OK,
-        tags=config_.tags,
-        **(decorator_extra_kwargs or {}),
-    )
     async def delete(uuid: UUID, service: ModelService = Depends(config_.service)) -> SQLTable:
         return await service.delete(uuid=uuid)
 
+    item_path = f"{config_.path}/{{uuid}}"
+    endpoints = [
+        ("PUT", config_.path, create, config_.response_model, http_status.HTTP_201_CREATED),
+        ("GET", config_.path, read_all, list[config_.response_model], http_status.HTTP_200_OK),
+        ("GET", item_path, read, config_.response_model, http_status.HTTP_200_OK),
+        ("PATCH", config_.path, update, config_.response_model, http_status.HTTP_200_OK),
+        ("DELETE", item_path, delete, config_.response_model, http_status.HTTP_200_OK),
+    ]
+    for method, path, endpoint, response_model, status_code in endpoints:
+        router_.add_api_route(
+            path=path,
+            endpoint=endpoint,
+            methods=[method],
+            response_model=response_model,
+            status_code=status_code,
+            tags=config_.tags,
+            **(decorator_extra_kwargs or {}),
+        )
+
 
 router = APIRouter()
 
@@ -177,8 +177,4 @@ model_endpoint_configs: list[ModelEndpointConfig] = [
 
 
 for config in model_endpoint_configs:
-    add_create_model_endpoint(router, config)
-    add_read_all_model_endpoint(router, config)
-    add_read_model_endpoint(router, config)
-    add_update_model_endpoint(router, config)
-    add_delete_model_endpoint(router, config)
+    add_model_endpoints(router, config)
@@ -1,6 +1,7 @@
 import logging
 
-from .check_source import CheckSourceService
+from .check_source import CheckSourceService, log_check_error
+from .db import async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
@@ -12,18 +13,19 @@ async def check_all_sources(
     Check all sources for new content and create articles for changed content.
     """
     logger.info("Checking all sources")
-    sources = await check_source_service.get_all_sources()
+    # The sources are listed in a short-lived session, so no connection stays checked out between runs.
+    async with async_sessionmaker() as session:
+        sources = await check_source_service.with_session(session).get_all_sources()
+    results = await check_source_service.check_many(sources)
 
     articles = []
     errors = []
 
-    for source in sources:
-        try:
-            article = await check_source_service.check_source(source_uuid=source.uuid)
-            if article:
-                articles.append(article)
-        except Exception as e:
-            logger.error(f"Error checking source {source.uuid}: {e}")
-            errors.append((source.uuid, str(e)))
+    for source, result in zip(sources, results, strict=True):
+        if isinstance(result, BaseException):
+            log_check_error(logger, source.uuid, result)
+            errors.append((source.uuid, str(result)))
+        elif result:
+            articles.append(result)
 
-    logger.info(f"Checked {len(sources)} sources, {len(articles)} articles created, {len(errors)} errors")
+    logger.info("Checked %s sources, %s articles created, %s errors", len(sources), len(articles), len(errors))
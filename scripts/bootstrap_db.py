@@ -12,13 +12,11 @@ Usage:
 import asyncio
 import logging
 import sys
-from typing import Any
+from dataclasses import dataclass
 
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-sys.path.append(".")  # Add the current directory to path for imports
-
 from app.db import async_sessionmaker, init_db
 from app.models.sources import Site, Source, SourceType, WatchableSelectorType
 from app.models.urls import AnyUrl
@@ -31,156 +29,179 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-SAMPLE_SITES: list[dict[str, Any]] = [
-    {
-        "name": "The New York Times",
-        "url": "https://www.nytimes.com",
-        "description": "The New York Times is an American daily newspaper based in New York City.",
-        "country": "USA",
-    },
-    {
-        "name": "BBC News",
-        "url": "https://www.bbc.com/news",
-        "description": "BBC News is an operational division of the British Broadcasting Corporation.",
-        "country": "GBR",
-    },
-    {
-        "name": "The Guardian",
-        "url": "https://www.theguardian.com",
-        "description": "The Guardian is a British daily newspaper.",
-        "country": "GBR",
-    },
-    {
-        "name": "Reuters",
-        "url": "https://www.reuters.com",
-        "description": "Reuters is an international news organization.",
-        "country": "GBR",
-    },
-    {
-        "name": "Al Jazeera",
-        "url": "https://www.aljazeera.com",
-        "description": "Al Jazeera is a Qatari international news channel.",
-        "country": "QAT",
-    },
-    {
-        "name": "RIA Novosti",
-        "url": "https://ria.ru",
-        "description": "RIA Novosti is a Russian state-owned news agency.",
-        "country": "RUS",
-    },
-    {
-        "name": "TASS",
-        "url": "https://tass.ru",
-        "description": "TASS is a major Russian news agency founded in 1904.",
-        "country": "RUS",
-    },
-    {
-        "name": "Kommersant",
-        "url": "https://www.kommersant.ru",
-        "description": "Kommersant is a nationally distributed daily newspaper published in Russia.",
-        "country": "RUS",
-    },
-    {
-        "name": "RT",
-        "url": "https://russian.rt.com",
-        "description": "RT is a Russian international television network.",
-        "country": "RUS",
-    },
-    {
-        "name": "Interfax",
-        "url": "https://www.interfax.ru",
-        "description": "Interfax is a major Russian news agency.",
-        "country": "RUS",
-    },
-]
-
-SAMPLE_SOURCE_TEMPLATES: list[dict[str, Any]] = [
+
+@dataclass(frozen=True, slots=True)
+class SiteSpec:
+    """Sample data for a Site to create."""
+
+    name: str
+    url: AnyUrl
+    description: str
+    country: str
+
+
+@dataclass(frozen=True, slots=True)
+class SourceSpec:
+    """Sample data for a Source to create, referencing its Site by name."""
+
+    site_name: str
+    type: SourceType
+    uri: AnyUrl
+    locale: str
+    watchable_selector: str
+    watchable_selector_type: WatchableSelectorType
+
+
+SAMPLE_SITES: tuple[SiteSpec, ...] = (
+    SiteSpec(
+        name="The New York Times",
+        url=AnyUrl("https://www.nytimes.com"),
+        description="The New York Times is an American daily newspaper based in New York City.",
+        country="USA",
+    ),
+    SiteSpec(
+        name="BBC News",
+        url=AnyUrl("https://www.bbc.com/news"),
+        description="BBC News is an operational division of the British Broadcasting Corporation.",
+        country="GBR",
+    ),
+    SiteSpec(
+        name="The Guardian",
+        url=AnyUrl("https://www.theguardian.com"),
+        description="The Guardian is a British daily newspaper.",
+        country="GBR",
+    ),
+    SiteSpec(
+        name="Reuters",
+        url=AnyUrl("https://www.reuters.com"),
+        description="Reuters is an international news organization.",
+        country="GBR",
+    ),
+    SiteSpec(
+        name="Al Jazeera",
+        url=AnyUrl("https://www.aljazeera.com"),
+        description="Al Jazeera is a Qatari international news channel.",
+        country="QAT",
+    ),
+    SiteSpec(
+        name="RIA Novosti",
+        url=AnyUrl("https://ria.ru"),
+        description="RIA Novosti is a Russian state-owned news agency.",
+        country="RUS",
+    ),
+    SiteSpec(
+        name="TASS",
+        url=AnyUrl("https://tass.ru"),
+        description="TASS is a major Russian news agency founded in 1904.",
+        country="RUS",
+    ),
+    SiteSpec(
+        name="Kommersant",
+        url=AnyUrl("https://www.kommersant.ru"),
+        description="Kommersant is a nationally distributed daily newspaper published in Russia.",
+        country="RUS",
+    ),
+    SiteSpec(
+        name="RT",
+        url=AnyUrl("https://russian.rt.com"),
+        description="RT is a Russian international television network.",
+        country="RUS",
+    ),
+    SiteSpec(
+        name="Interfax",
+        url=AnyUrl("https://www.interfax.ru"),
+        description="Interfax is a major Russian news agency.",
+        country="RUS",
+    ),
+)
+
+SAMPLE_SOURCE_TEMPLATES: tuple[SourceSpec, ...] = (
     # RSS feeds
-    {
-        "site_name": "The New York Times",
-        "type": SourceType.RSS,
-        "uri": "https://rss.nytimes.com/services/xml/rss/nyt/World.xml",
-        "locale": "en",
-        "watchable_selector": "//item",
-        "watchable_selector_type": WatchableSelectorType.XPATH,
-    },
-    {
-        "site_name": "BBC News",
-        "type": SourceType.RSS,
-        "uri": "http://feeds.bbci.co.uk/news/world/rss.xml",
-        "locale": "en",
-        "watchable_selector": "//item",
-        "watchable_selector_type": WatchableSelectorType.XPATH,
-    },
-    {
-        "site_name": "The Guardian",
-        "type": SourceType.RSS,
-        "uri": "https://www.theguardian.com/world/rss",
-        "locale": "en",
-        "watchable_selector": "//item",
-        "watchable_selector_type": WatchableSelectorType.XPATH,
-    },
+    SourceSpec(
+        site_name="The New York Times",
+        type=SourceType.RSS,
+        uri=AnyUrl("https://rss.nytimes.com/services/xml/rss/nyt/World.xml"),
+        locale="en",
+        watchable_selector="//item",
+        watchable_selector_type=WatchableSelectorType.XPATH,
+    ),
+    SourceSpec(
+        site_name="BBC News",
+        type=SourceType.RSS,
+        uri=AnyUrl("http://feeds.bbci.co.uk/news/world/rss.xml"),
+        locale="en",
+        watchable_selector="//item",
+        watchable_selector_type=WatchableSelectorType.XPATH,
+    ),
+    SourceSpec(
+        site_name="The Guardian",
+        type=SourceType.RSS,
+        uri=AnyUrl("https://www.theguardian.com/world/rss"),
+        locale="en",
+        watchable_selector="//item",
+        watchable_selector_type=WatchableSelectorType.XPATH,
+    ),
     # Web pages
-    {
-        "site_name": "Reuters",
-        "type": SourceType.WEBPAGE,
-        "uri": "https://www.reuters.com/world/",
-        "locale": "en",
-        "watchable_selector": "article.story",
-        "watchable_selector_type": WatchableSelectorType.CSS,
-    },
-    {
-        "site_name": "Al Jazeera",
-        "type": SourceType.WEBPAGE,
-        "uri": "https://www.aljazeera.com/news/",
-        "locale": "en",
-        "watchable_selector": "#featured-news-container",
-        "watchable_selector_type": WatchableSelectorType.CSS,
-    },
-    {
-        "site_name": "RIA Novosti",
-        "type": SourceType.WEBPAGE,
-        "uri": "https://ria.ru/world/",
-        "locale": "ru",
-        "watchable_selector": ".rubric-list .list-item",
-        "watchable_selector_type": WatchableSelectorType.CSS,
-    },
-    {
-        "site_name": "TASS",
-        "type": SourceType.WEBPAGE,
-        "uri": "https://tass.ru/mezhdunarodnaya-panorama",
-        "locale": "ru",
-        "watchable_selector": "#infinite_listing a",
-        "watchable_selector_type": WatchableSelectorType.CSS,
-    },
-    {
-        "site_name": "Kommersant",
-        "type": SourceType.WEBPAGE,
-        "uri": "https://www.kommersant.ru/rubric/5",
-        "locale": "ru",
-        "watchable_selector": ".rubric_lenta > article",
-        "watchable_selector_type": WatchableSelectorType.CSS,
-    },
-    {
-        "site_name": "RT",
-        "type": SourceType.WEBPAGE,
-        "uri": "https://russian.rt.com/world",
-        "locale": "ru",
-        "watchable_selector": ".listing__column_sections",
-        "watchable_selector_type": WatchableSelectorType.CSS,
-    },
-    {
-        "site_name": "Interfax",
-        "type": SourceType.WEBPAGE,
-        "uri": "https://www.interfax.ru/world/",
-        "locale": "ru",
-        "watchable_selector": ".timeline",
-        "watchable_selector_type": WatchableSelectorType.CSS,
-    },
-]
-
-
-async def create_site(session: AsyncSession, site_data: dict[str, Any]) -> Site:
+    SourceSpec(
+        site_name="Reuters",
+        type=SourceType.WEBPAGE,
+        uri=AnyUrl("https://www.reuters.com/world/"),
+        locale="en",
+        watchable_selector="article.story",
+        watchable_selector_type=WatchableSelectorType.CSS,
+    ),
+    SourceSpec(
+        site_name="Al Jazeera",
+        type=SourceType.WEBPAGE,
+        uri=AnyUrl("https://www.aljazeera.com/news/"),
+        locale="en",
+        watchable_selector="#featured-news-container",
+        watchable_selector_type=WatchableSelectorType.CSS,
+    ),
+    SourceSpec(
+        site_name="RIA Novosti",
+        type=SourceType.WEBPAGE,
+        uri=AnyUrl("https://ria.ru/world/"),
+        locale="ru",
+        watchable_selector=".rubric-list .list-item",
+        watchable_selector_type=WatchableSelectorType.CSS,
+    ),
+    SourceSpec(
+        site_name="TASS",
+        type=SourceType.WEBPAGE,
+        uri=AnyUrl("https://tass.ru/mezhdunarodnaya-panorama"),
+        locale="ru",
+        watchable_selector="#infinite_listing a",
+        watchable_selector_type=WatchableSelectorType.CSS,
+    ),
+    SourceSpec(
+        site_name="Kommersant",
+        type=SourceType.WEBPAGE,
+        uri=AnyUrl("https://www.kommersant.ru/rubric/5"),
+        locale="ru",
+        watchable_selector=".rubric_lenta > article",
+        watchable_selector_type=WatchableSelectorType.CSS,
+    ),
+    SourceSpec(
+        site_name="RT",
+        type=SourceType.WEBPAGE,
+        uri=AnyUrl("https://russian.rt.com/world"),
+        locale="ru",
+        watchable_selector=".listing__column_sections",
+        watchable_selector_type=WatchableSelectorType.CSS,
+    ),
+    SourceSpec(
+        site_name="Interfax",
+        type=SourceType.WEBPAGE,
+        uri=AnyUrl("https://www.interfax.ru/world/"),
+        locale="ru",
+        watchable_selector=".timeline",
+        watchable_selector_type=WatchableSelectorType.CSS,
+    ),
+)
+
+
+def create_site(session: AsyncSession, site_data: SiteSpec, existing_sites: dict[AnyUrl, Site]) -> Site:
     """
     Create a Site in the database.
 
@@ -188,39 +209,36 @@ async def create_site(session: AsyncSession, site_data: dict[str, Any]) -> Site:
     ----------
     session : AsyncSession
         The database session
-    site_data : dict[str, Any]
+    site_data : SiteSpec
         The site data to create
+    existing_sites : dict[AnyUrl, Site]
+        A mapping of URLs to the active sites already in the database
 
     Returns
     -------
     Site
         The created site instance
     """
-    # Check if site already exists
-    stmt = select(Site).where(Site.url == site_data["url"], Site.active)
-    result = await session.exec(stmt)
-    existing_site = result.first()
-
-    if existing_site:
-        logger.info(f"Site {site_data['name']} already exists, skipping creation")
+    if existing_site := existing_sites.get(site_data.url):
+        logger.debug("Site %s already exists, skipping creation", site_data.name)
         return existing_site
 
     # Create new site
     site = Site(
-        url=AnyUrl(site_data["url"]),
-        name=site_data["name"],
-        description=site_data["description"],
-        country=site_data["country"],
+        url=site_data.url,
+        name=site_data.name,
+        description=site_data.description,
+        country=site_data.country,
     )
 
     session.add(site)
-    await session.commit()
-    await session.refresh(site)
-    logger.info(f"Created site: {site.name} ({site.uuid})")
+    logger.debug("Created site: %s (%s)", site.name, site.uuid)
     return site
 
 
-async def create_source(session: AsyncSession, source_data: dict[str, Any], site_map: dict[str, Site]) -> Source | None:
+def create_source(
+    session: AsyncSession, source_data: SourceSpec, site_map: dict[str, Site], existing_sources: dict[AnyUrl, Source]
+) -> Source | None:
     """
     Create a Source in the database.
 
@@ -228,43 +246,39 @@ async def create_source(session: AsyncSession, source_data: dict[str, Any], site
     ----------
     session : AsyncSession
         The database session
-    source_data : dict[str, Any]
+    source_data : SourceSpec
         The source data to create
     site_map : dict[str, Site]
         A mapping of site names to Site objects
+    existing_sources : dict[AnyUrl, Source]
+        A mapping of URIs to the active sources already in the database
 
     Returns
     -------
     Source
         The created source instance or None if the site is not found
     """
-    site = site_map.get(source_data["site_name"])
+    site = site_map.get(source_data.site_name)
     if not site:
-        logger.error(f"Site {source_data['site_name']} not found, cannot create source")
+        logger.error("Site %s not found, cannot create source", source_data.site_name)
         return None
 
-    # Check if source already exists
-    stmt = select(Source).where(Source.uri == source_data["uri"], Source.active)
-    result = await session.exec(stmt)
-
-    if existing_source := result.first():
-        logger.info(f"Source {source_data['uri']} already exists, skipping creation")
+    if existing_source := existing_sources.get(source_data.uri):
+        logger.debug("Source %s already exists, skipping creation", source_data.uri)
         return existing_source
 
     # Create new source
     source = Source(
         site_uuid=site.uuid,
-        type=source_data["type"],
-        locale=source_data["locale"],
-        uri=AnyUrl(source_data["uri"]),
-        watchable_selector=source_data["watchable_selector"],
-        watchable_selector_type=source_data["watchable_selector_type"],
+        type=source_data.type,
+        locale=source_data.locale,
+        uri=source_data.uri,
+        watchable_selector=source_data.watchable_selector,
+        watchable_selector_type=source_data.watchable_selector_type,
     )
 
     session.add(source)
-    await session.commit()
-    await session.refresh(source)
-    logger.info(f"Created source: {source.type.name} for site {site.name} ({source.uuid})")
+    logger.debug("Created source: %s for site %s (%s)", source.type.name, site.name, source.uuid)
     return source
 
 
@@ -273,20 +287,43 @@ async def bootstrap_database() -> None:
     logger.info("Initializing database...")
     await init_db()
 
-    async with async_sessionmaker() as session:
+    async with async_sessionmaker.begin() as session:
+        # Look up the sites and sources that already exist in one query each
+        site_urls = [site_data.url for site_data in SAMPLE_SITES]
+        stmt = select(Site).where(col(Site.url).in_(site_urls), Site.active)
+        existing_sites = {site.url: site for site in await session.exec(stmt)}
+
+        source_uris = [source_data.uri for source_data in SAMPLE_SOURCE_TEMPLATES]
+        stmt = select(Source).where(col(Source.uri).in_(source_uris), Source.active)
+        existing_sources = {source.uri: source for source in await session.exec(stmt)}
+
         # Create sites
         site_map = {}
+        sites_created = 0
         logger.info("Creating sites...")
         for site_data in SAMPLE_SITES:
-            site = await create_site(session, site_data)
+            site = create_site(session, site_data, existing_sites)
             site_map[site.name] = site
+            sites_created += site_data.url not in existing_sites
+        logger.info("Sites: %d created, %d already existed", sites_created, len(SAMPLE_SITES) - sites_created)
 
         # Create sources for each site
+        sources_created = sources_failed = 0
         logger.info("Creating sources...")
         for source_data in SAMPLE_SOURCE_TEMPLATES:
-            await create_source(session, source_data, site_map)
+            source = create_source(session, source_data, site_map, existing_sources)
+            if source is None:
+                sources_failed += 1
+            elif source_data.uri not in existing_sources:
+                sources_created += 1
+        logger.info(
+            "Sources: %d created, %d already existed, %d failed",
+            sources_created,
+            len(SAMPLE_SOURCE_TEMPLATES) - sources_created - sources_failed,
+            sources_failed,
+        )
 
-        logger.info("Database bootstrapping completed successfully!")
+    logger.info("Database bootstrapping completed successfully!")
 
 
 async def main() -> None:
@@ -294,8 +331,8 @@ async def main() -> None:
     try:
         logger.info("Starting database bootstrap process")
         await bootstrap_database()
-    except Exception as e:
-        logger.exception(f"Error bootstrapping database: {str(e)}")
+    except Exception:
+        logger.exception("Error bootstrapping database")
         sys.exit(1)
 
 